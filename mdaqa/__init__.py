@@ -0,0 +1,30 @@
+"""
+MDAQA: Multi-Document Academic Question Answering Dataset Generation Framework
+
+This package provides tools for generating complex, multi-document question-answering
+pairs from academic paper communities.
+"""
+
+__version__ = "1.0.0"
+__author__ = "Hui HUANG"
+__email__ = "hui.huang@univ-lyon2.fr"
+
+import importlib
+
+# Public classes are imported on first access so that importing the package
+# (e.g. for the command-line interface) stays cheap
+_EXPORTS = {
+    "LLMClient": ".llm_client",
+    "create_llm_client": ".llm_client",
+    "DataLoader": ".data_loader",
+    "QuestionGenerator": ".question_generator",
+    "QualityEvaluator": ".quality_evaluator"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
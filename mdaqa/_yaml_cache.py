@@ -0,0 +1,29 @@
+"""
+Cached YAML loading shared by the MDAQA components.
+"""
+import copy
+import functools
+import os
+from typing import Any, Dict
+
+import yaml
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML file; `mtime` is only part of the cache key."""
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def load_yaml_cached(path: str) -> Dict[str, Any]:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Returns a deep copy so callers can never alter the cached configuration.
+    """
+    path = os.path.abspath(path)
+    return copy.deepcopy(_parse(path, os.path.getmtime(path)))
@@ -0,0 +1,104 @@
+"""
+Pack the SPIQA paper files into a single memory-mappable corpus.
+
+The SPIQA directory is scanned once, every paper is filtered and cleaned
+exactly as DataLoader would do it, and the results are written to:
+
+  papers.bin   concatenated UTF-8 content of all accepted papers
+  index.json   arxiv_id -> [offset, length, crc32] into papers.bin, plus
+               the settings and SPIQA directory state the pack was built
+               from and the size of papers.bin
+
+Both files are written under temporary names and swapped in, index.json
+last, so an interrupted build never leaves a pack that looks valid.
+
+Point `data.spiqa_pack` in the configuration at the output directory to
+make DataLoader read papers from the pack. Run with:
+
+  python -m mdaqa.build_pack --output ./spiqa/packed
+"""
+import argparse
+import json
+import os
+import sys
+import zlib
+
+from ._yaml_cache import load_yaml_cached
+from .data_loader import DataLoader, SPIQA_PACK_DATA, SPIQA_PACK_INDEX
+
+
+def build_pack(config_path: str, output_dir: str) -> None:
+    """Build papers.bin and index.json for the configured SPIQA directory."""
+    loader = DataLoader(config_path)
+    spiqa_path = loader.config['data']['spiqa_path']
+    min_file_size = loader.config['processing']['min_file_size']
+    max_file_size = loader.config['processing']['max_file_size']
+    
+    papers = {}
+    offset = 0
+    
+    # Taken before the scan, so files added during the build mark it stale
+    spiqa_mtime_ns = os.stat(spiqa_path).st_mtime_ns
+    
+    os.makedirs(output_dir, exist_ok=True)
+    data_path = os.path.join(output_dir, SPIQA_PACK_DATA)
+    index_path = os.path.join(output_dir, SPIQA_PACK_INDEX)
+    
+    with open(f"{data_path}.tmp", 'wb') as f:
+        for arxiv_id in sorted(loader._build_spiqa_index(spiqa_path)):
+            content = loader._read_paper_file(
+                arxiv_id, spiqa_path, min_file_size * 1024, max_file_size * 1024
+            )
+            if not content:
+                continue
+            
+            data = content.encode('utf-8')
+            f.write(data)
+            papers[arxiv_id] = [offset, len(data), zlib.crc32(data)]
+            offset += len(data)
+    
+    pack_index = {
+        "spiqa_path": spiqa_path,
+        "spiqa_mtime_ns": spiqa_mtime_ns,
+        "min_file_size": min_file_size,
+        "max_file_size": max_file_size,
+        "data_size": offset,
+        "papers": papers
+    }
+    with open(f"{index_path}.tmp", 'w', encoding='utf-8') as f:
+        json.dump(pack_index, f)
+    
+    # Swap the index in last: until then the old index no longer matches
+    # the new papers.bin size and is rejected
+    os.replace(f"{data_path}.tmp", data_path)
+    os.replace(f"{index_path}.tmp", index_path)
+    
+    print(f"Packed {len(papers)} papers ({offset / 1024 / 1024:.1f} MB) into {output_dir}")
+
+
+def main():
+    """Main function with command-line interface."""
+    parser = argparse.ArgumentParser(description="Pack the SPIQA corpus for faster loading")
+    parser.add_argument(
+        '--config',
+        default='config/config.yaml',
+        help='Path to configuration file (default: config/config.yaml)'
+    )
+    parser.add_argument(
+        '--output',
+        help='Output directory (default: data.spiqa_pack from the configuration)'
+    )
+    args = parser.parse_args()
+    
+    output_dir = args.output
+    if output_dir is None:
+        output_dir = load_yaml_cached(args.config)['data'].get('spiqa_pack')
+    if not output_dir:
+        print("Error: no output directory given and data.spiqa_pack is not configured.")
+        sys.exit(1)
+    
+    build_pack(args.config, output_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,555 @@
+"""
+Data loading utilities for MDAQA project.
+"""
+import json
+import mmap
+import os
+import re
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Tuple, Optional, Any
+
+from ._yaml_cache import load_yaml_cached
+
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(data: Any, compact: bool = False) -> bytes:
+        option = orjson.OPT_APPEND_NEWLINE if compact else orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(data, option=option)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(data: Any, compact: bool = False) -> bytes:
+        if compact:
+            text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        else:
+            text = json.dumps(data, indent=2, ensure_ascii=False)
+        return (text + "\n").encode('utf-8')
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# SPIQA paper files are named "<arxiv_id>v<version>.txt", optionally
+# zstd-compressed as "<arxiv_id>v<version>.txt.zst"
+_SPIQA_FILE_RE = re.compile(r'^(.+)v(\d+)\.txt(\.zst)?$')
+_MAX_PAPER_VERSION = 14
+
+# Papers whose first line contains this LaTeX command are skipped
+_SECTION_MARKER = b"\\section"
+
+# Shared pool for loading paper files concurrently; threads start on demand
+_IO_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="mdaqa-io")
+
+# zstd decompressors must not be shared between threads
+_zstd_local = threading.local()
+
+
+def _decompress_paper(data: bytes, max_size: int) -> Optional[bytes]:
+    """Decompress a zstd-compressed paper, or None if too large or corrupt."""
+    dctx = getattr(_zstd_local, 'dctx', None)
+    if dctx is None:
+        dctx = _zstd_local.dctx = zstandard.ZstdDecompressor()
+    
+    try:
+        # Reject oversized papers from the frame header without decompressing
+        if zstandard.frame_content_size(data) > max_size:
+            return None
+        data = dctx.decompress(data, max_output_size=max_size + 1)
+    except zstandard.ZstdError:
+        return None
+    
+    return data if len(data) <= max_size else None
+
+
+def _may_fit(file_path: str, file_size: int, min_size: int, max_size: int) -> bool:
+    """Whether a paper file can pass the size filter, judging by its size on disk."""
+    # Compressed files are only measured once decompressed
+    return file_path.endswith('.zst') or min_size <= file_size <= max_size
+
+
+def _check_community(community: Any, position: int) -> None:
+    """Raise ValueError unless a community record has the expected fields."""
+    if not isinstance(community, dict):
+        raise ValueError(f"Invalid community data format: record {position} is not an object")
+    
+    community_id = community.get('community_id')
+    if isinstance(community_id, bool) or not isinstance(community_id, (int, str)):
+        raise ValueError(
+            f"Invalid community data format: record {position} needs a string or integer 'community_id'"
+        )
+    
+    papers = community.get('papers')
+    if not isinstance(papers, list) or not all(isinstance(paper, str) for paper in papers):
+        raise ValueError(
+            f"Invalid community data format: community {community_id} needs a 'papers' list of IDs"
+        )
+
+
+def _journal_path(file_path: str) -> str:
+    """Path of the append-only journal kept next to a progress file."""
+    return f"{file_path}.jsonl"
+
+
+# Upper bound on the on-disk paper cache
+_PAPER_CACHE_SIZE_LIMIT = 4 * 1024 ** 3
+
+# Distinguishes a cache miss from a cached rejection (None)
+_CACHE_MISS = object()
+
+
+# File names of a packed SPIQA corpus (see mdaqa.build_pack)
+SPIQA_PACK_DATA = "papers.bin"
+SPIQA_PACK_INDEX = "index.json"
+
+
+class DataLoader:
+    """Handles loading and processing of input data files."""
+    
+    # Parsed input files shared across instances, keyed by path: (mtime, data)
+    _json_cache: Dict[str, Tuple[float, Any]] = {}
+    
+    def __init__(self, config_path: str = "config/config.yaml"):
+        """Initialize data loader with configuration."""
+        self.config = load_yaml_cached(config_path)
+        self._spiqa_index: Dict[str, Dict[str, List[Tuple[int, str, int, int]]]] = {}
+        self._spiqa_index_lock = threading.Lock()
+        
+        self._papers_mm: Optional[mmap.mmap] = None
+        self._papers_idx: Dict[str, Tuple[int, int, int]] = {}
+        self._papers_key: Optional[Tuple[str, int, int]] = None
+        self._open_spiqa_pack()
+        
+        self._paper_cache = self._open_paper_cache()
+    
+    def _open_spiqa_pack(self) -> None:
+        """Memory-map the packed SPIQA corpus if one is configured."""
+        pack_dir = self.config['data'].get('spiqa_pack')
+        if not pack_dir:
+            return
+        
+        index_path = os.path.join(pack_dir, SPIQA_PACK_INDEX)
+        if not os.path.exists(index_path):
+            print(f"Warning: SPIQA pack not found at {pack_dir}, reading paper files instead")
+            return
+        
+        with open(index_path, 'rb') as f:
+            pack_index = _json_loads(f.read())
+        
+        # The pack holds already-filtered content, so it is only valid for
+        # the settings it was built with
+        key = (
+            pack_index['spiqa_path'],
+            pack_index['min_file_size'] * 1024,
+            pack_index['max_file_size'] * 1024
+        )
+        expected = (
+            self.config['data']['spiqa_path'],
+            self.config['processing']['min_file_size'] * 1024,
+            self.config['processing']['max_file_size'] * 1024
+        )
+        if key != expected:
+            print(f"Warning: SPIQA pack at {pack_dir} was built with different settings, ignoring it")
+            return
+        
+        # Adding or removing SPIQA files after the build makes the pack stale
+        try:
+            spiqa_mtime_ns = os.stat(self.config['data']['spiqa_path']).st_mtime_ns
+        except FileNotFoundError:
+            spiqa_mtime_ns = None
+        if pack_index.get('spiqa_mtime_ns') != spiqa_mtime_ns:
+            print(f"Warning: SPIQA pack at {pack_dir} is older than the SPIQA directory, ignoring it")
+            return
+        
+        # papers.bin must be the file this index was written for
+        data_path = os.path.join(pack_dir, SPIQA_PACK_DATA)
+        data_size = os.path.getsize(data_path) if os.path.exists(data_path) else None
+        if pack_index.get('data_size') != data_size:
+            print(f"Warning: SPIQA pack at {pack_dir} is incomplete, ignoring it")
+            return
+        
+        self._papers_idx = {
+            arxiv_id: tuple(location) for arxiv_id, location in pack_index['papers'].items()
+        }
+        self._papers_key = key
+        
+        if self._papers_idx:
+            fd = os.open(data_path, os.O_RDONLY)
+            try:
+                self._papers_mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+            finally:
+                os.close(fd)
+    
+    def _open_paper_cache(self):
+        """Open the on-disk cache of cleaned paper contents, if configured."""
+        cache_dir = self.config['data'].get('paper_cache')
+        if not cache_dir:
+            return None
+        
+        if diskcache is None:
+            print("Warning: data.paper_cache is set but diskcache is not installed, caching disabled")
+            return None
+        
+        return diskcache.Cache(cache_dir, size_limit=_PAPER_CACHE_SIZE_LIMIT)
+    
+    def _load_json_cached(self, file_path: str) -> Any:
+        """
+        Load a JSON input file, reusing the parsed data while it is unchanged.
+        
+        The returned object is shared between callers and must be treated as
+        read-only.
+        """
+        mtime = os.path.getmtime(file_path)
+        key = os.path.abspath(file_path)
+        
+        cached = DataLoader._json_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with open(file_path, 'rb') as f:
+            data = _json_loads(f.read())
+        
+        DataLoader._json_cache[key] = (mtime, data)
+        return data
+    
+    def load_community_data(self) -> List[Dict[str, Any]]:
+        """Load community detection results (shared, read-only)."""
+        community_path = self.config['data']['community_data']
+        try:
+            data = self._load_json_cached(community_path)
+            
+            # Handle both single community and list of communities
+            communities = [data] if isinstance(data, dict) else data
+            if not isinstance(communities, list):
+                raise ValueError("Invalid community data format")
+            
+            # Validate every record up front rather than failing mid-run
+            for position, community in enumerate(communities):
+                _check_community(community, position)
+            
+            return communities
+                
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Community data file not found: {community_path}\n"
+                "Please provide the community detection results file."
+            )
+    
+    def load_semantic_mapping(self) -> Dict[str, Dict[str, str]]:
+        """Load semantic ID to arXiv ID mapping (shared, read-only)."""
+        mapping_path = self.config['data']['semantic_mapping']
+        try:
+            return self._load_json_cached(mapping_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Semantic mapping file not found: {mapping_path}\n"
+                "Please provide the semantic to arXiv ID mapping file."
+            )
+    
+    def get_paper_content(self, arxiv_ids: List[Tuple[str, str]]) -> Tuple[Optional[str], List[Tuple[str, str]]]:
+        """
+        Load paper content from SPIQA dataset.
+        
+        Args:
+            arxiv_ids: List of (arxiv_id, title) tuples
+            
+        Returns:
+            Tuple of (combined_content, valid_arxiv_ids)
+        """
+        spiqa_path = self.config['data']['spiqa_path']
+        min_size = self.config['processing']['min_file_size'] * 1024  # Convert to bytes
+        max_size = self.config['processing']['max_file_size'] * 1024
+        max_content_length = self.config['processing']['max_content_length']
+        
+        total_length = 0
+        valid_arxiv_ids = []
+        
+        # Papers come straight from the memory-mapped pack when one is loaded
+        if self._papers_key == (spiqa_path, min_size, max_size):
+            candidates = [paper for paper in arxiv_ids if paper[0] in self._papers_idx]
+        else:
+            # Build the directory index up front so worker threads only read it
+            index = self._build_spiqa_index(spiqa_path)
+            
+            # Drop papers with no file that can pass the size filter, using
+            # the sizes recorded in the index
+            candidates = [
+                (arxiv_id, title) for arxiv_id, title in arxiv_ids
+                if any(_may_fit(file_path, file_size, min_size, max_size)
+                       for _, file_path, file_size, _ in index.get(arxiv_id, ()))
+            ]
+        
+        # Need at least 2 papers for multi-document QA; reject without any reads
+        if len(candidates) <= 1:
+            return None, None
+        
+        # Load papers concurrently and total their length as they complete,
+        # so an oversized community is rejected without waiting on the rest
+        futures = {
+            _IO_POOL.submit(self._load_single_paper, arxiv_id, spiqa_path, min_size, max_size): i
+            for i, (arxiv_id, _) in enumerate(candidates)
+        }
+        parts: List[Optional[str]] = [None] * len(candidates)
+        
+        for future in as_completed(futures):
+            content = future.result()
+            if content:
+                i = futures[future]
+                arxiv_id, title = candidates[i]
+                part = f"**title**: {title}\n**arxiv_id**: {arxiv_id}\n**content**: {content}\n\n"
+                total_length += len(part)
+                
+                # Check total content length as soon as it is exceeded
+                if total_length > max_content_length:
+                    for pending in futures:
+                        pending.cancel()
+                    return None, None
+                
+                parts[i] = part
+        
+        # Keep papers in their input order
+        for (arxiv_id, title), part in zip(candidates, parts):
+            if part is not None:
+                valid_arxiv_ids.append((arxiv_id, title))
+        
+        # Need at least 2 papers for multi-document QA
+        if len(valid_arxiv_ids) <= 1:
+            return None, None
+        
+        return "".join(part for part in parts if part is not None), valid_arxiv_ids
+    
+    def _build_spiqa_index(self, spiqa_path: str) -> Dict[str, List[Tuple[int, str, int, int]]]:
+        """
+        Index the SPIQA directory with a single scan.
+        
+        Returns:
+            Mapping of arxiv_id to its (version, file_path, file_size, mtime_ns)
+            entries, sorted by ascending version with compressed files first;
+            file_size is the size on disk
+        """
+        if spiqa_path in self._spiqa_index:
+            return self._spiqa_index[spiqa_path]
+        
+        # Worker threads can get here when a pack entry is corrupt; the lock
+        # keeps them from each scanning the directory
+        with self._spiqa_index_lock:
+            if spiqa_path in self._spiqa_index:
+                return self._spiqa_index[spiqa_path]
+            
+            index: Dict[str, List[Tuple[int, str, int, int]]] = {}
+            try:
+                with os.scandir(spiqa_path) as entries:
+                    for entry in entries:
+                        match = _SPIQA_FILE_RE.match(entry.name)
+                        if not match or not entry.is_file():
+                            continue
+                        
+                        # Compressed papers need the optional zstandard package
+                        if match.group(3) and zstandard is None:
+                            continue
+                        
+                        version = int(match.group(2))
+                        if not 1 <= version <= _MAX_PAPER_VERSION:
+                            continue
+                        
+                        stat = entry.stat()
+                        index.setdefault(match.group(1), []).append(
+                            (version, entry.path, stat.st_size, stat.st_mtime_ns)
+                        )
+            except FileNotFoundError:
+                print(f"Warning: SPIQA directory not found: {spiqa_path}")
+            
+            for versions in index.values():
+                versions.sort(key=lambda entry: (entry[0], not entry[1].endswith('.zst')))
+            
+            self._spiqa_index[spiqa_path] = index
+            return index
+    
+    def _load_single_paper(self, arxiv_id: str, spiqa_path: str, 
+                          min_size: int, max_size: int) -> Optional[str]:
+        """Load content for a single paper."""
+        if self._papers_key == (spiqa_path, min_size, max_size):
+            location = self._papers_idx.get(arxiv_id)
+            if location is None:
+                return None
+            
+            offset, length, checksum = location
+            data = self._papers_mm[offset:offset + length]
+            if zlib.crc32(data) == checksum:
+                try:
+                    return data.decode('utf-8')
+                except UnicodeDecodeError:
+                    pass
+            
+            # A damaged pack entry falls back to the paper files
+            print(f"Warning: SPIQA pack entry for {arxiv_id} is corrupt, reading paper files instead")
+        
+        if self._paper_cache is None:
+            return self._read_paper_file(arxiv_id, spiqa_path, min_size, max_size)
+        
+        # Any change to the paper's files or the size limits changes the key
+        versions = self._build_spiqa_index(spiqa_path).get(arxiv_id, ())
+        key = (
+            arxiv_id, min_size, max_size,
+            tuple((file_path, file_size, mtime_ns) for _, file_path, file_size, mtime_ns in versions)
+        )
+        
+        content = self._paper_cache.get(key, default=_CACHE_MISS)
+        if content is _CACHE_MISS:
+            io_errors = []
+            content = self._read_paper_file(arxiv_id, spiqa_path, min_size, max_size,
+                                            io_errors=io_errors)
+            # Only cache deliberate results; a failed read is retried next time
+            if not io_errors:
+                self._paper_cache.set(key, content)
+        return content
+    
+    def _read_paper_file(self, arxiv_id: str, spiqa_path: str, 
+                         min_size: int, max_size: int,
+                         io_errors: Optional[List[OSError]] = None) -> Optional[str]:
+        """
+        Read and clean a single paper from the SPIQA directory.
+        
+        Args:
+            arxiv_id: ArXiv ID of the paper
+            spiqa_path: Path to the SPIQA directory
+            min_size: Minimum file size in bytes
+            max_size: Maximum file size in bytes
+            io_errors: Optional list collecting the I/O errors of skipped versions
+            
+        Returns:
+            Cleaned paper content, or None if no version was accepted
+        """
+        # Try available versions, lowest first
+        for version, file_path, file_size, _ in self._build_spiqa_index(spiqa_path).get(arxiv_id, ()):
+            # Check file size
+            if not _may_fit(file_path, file_size, min_size, max_size):
+                continue
+            
+            try:
+                # Read the whole file in one pass and clean it as bytes; the
+                # unbuffered file sizes its single read from fstat
+                with open(file_path, 'rb', buffering=0) as f:
+                    data = f.read()
+                
+                if file_path.endswith('.zst'):
+                    data = _decompress_paper(data, max_size)
+                    if data is None or len(data) < min_size:
+                        continue
+                
+                # Match the newline translation of text-mode reads
+                if b"\r" in data:
+                    data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+                
+                # Skip files that start with LaTeX sections; search the first
+                # line in place instead of slicing a copy of it
+                first_line_end = data.find(b"\n")
+                if first_line_end == -1:
+                    first_line_end = len(data)
+                if data.find(_SECTION_MARKER, 0, first_line_end) != -1:
+                    continue
+                
+                return data.replace(b"\n\n", b"\n").decode('utf-8')
+                    
+            except UnicodeDecodeError:
+                continue
+            except OSError as e:
+                if io_errors is not None:
+                    io_errors.append(e)
+                continue
+        
+        return None
+    
+    def load_progress(self, file_path: str) -> Dict[str, Any]:
+        """
+        Load progress from a JSON file.
+        
+        Records appended with save_progress(append_record=...) since the last
+        full save are replayed on top of the file's contents.
+        """
+        data = {}
+        if os.path.exists(file_path):
+            with open(file_path, 'rb') as f:
+                data = _json_loads(f.read())
+        
+        journal_path = _journal_path(file_path)
+        if not os.path.exists(journal_path):
+            return data
+        
+        with open(journal_path, 'rb+') as f:
+            journal = f.read()
+            # A crash mid-append leaves a partial last line; cut it off so
+            # the resumed run's records start on a line of their own
+            end = journal.rfind(b"\n") + 1
+            if end < len(journal):
+                f.truncate(end)
+        
+        for line in journal[:end].splitlines():
+            try:
+                record = _json_loads(line)
+            except ValueError:
+                print(f"Warning: Skipping unreadable record in {journal_path}")
+                continue
+            
+            if "index" in record:
+                # Progress from before list checkpoints may be a dict
+                if not isinstance(data, list):
+                    data = []
+                # Records already in the file are skipped, so replaying
+                # after an interrupted full save is harmless
+                if record["index"] >= len(data):
+                    data.append(record["item"])
+            else:
+                data[record["key"]] = record["value"]
+        
+        return data
+    
+    def save_progress(self, data: Dict[str, Any], file_path: str, *, 
+                      append_record: Any = None) -> None:
+        """
+        Save progress to a JSON file.
+        
+        Args:
+            data: Complete progress, a dict or a list
+            file_path: Progress file to write
+            append_record: Only record the latest change instead of rewriting
+                the file: a (key, value) pair for dict progress, or the item
+                just appended for list progress. The change is appended to a
+                journal next to the file, which load_progress replays and the
+                next full save folds in.
+        """
+        # Ensure output directory exists
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        journal_path = _journal_path(file_path)
+        
+        if append_record is not None:
+            if isinstance(data, list):
+                record = {"index": len(data) - 1, "item": append_record}
+            else:
+                key, value = append_record
+                record = {"key": key, "value": value}
+            
+            with open(journal_path, 'ab') as f:
+                f.write(_json_dumps(record, compact=True))
+            return
+        
+        # Write to a temporary file and swap it in, so a crash never
+        # leaves a truncated progress file behind
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(data))
+        os.replace(tmp_path, file_path)
+        
+        # The file now holds every journaled change
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
@@ -0,0 +1,350 @@
+"""
+Unified LLM client that supports multiple providers.
+"""
+import asyncio
+import functools
+import os
+import json
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
+
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from ._yaml_cache import load_yaml_cached
+
+
+@functools.lru_cache(maxsize=None)
+def _load_openai():
+    """Import the OpenAI SDK on first use."""
+    import openai
+    return openai
+
+
+@functools.lru_cache(maxsize=None)
+def _load_anthropic():
+    """Import the Anthropic SDK on first use."""
+    import anthropic
+    return anthropic
+
+
+# SDK clients shared by all LLMClient instances, keyed by provider settings
+_CLIENT_CACHE: Dict[Tuple, Any] = {}
+
+# Status codes the SDKs themselves treat as transient, besides any 5xx
+_RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+def _retry_after(error: Optional[BaseException]) -> Optional[float]:
+    """Seconds requested by a Retry-After header on an API error, if any."""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    """Report a failed attempt before sleeping."""
+    error = retry_state.outcome.exception()
+    print(f"Error occurred: {error}. Retrying in {retry_state.next_action.sleep:.2f} seconds...")
+
+
+class LLMClient:
+    """Unified client for different LLM providers."""
+    
+    def __init__(self, config_path: str = "config/config.yaml"):
+        """Initialize the LLM client with configuration."""
+        self.config = self._load_config(config_path)
+        self._provider = self.config['llm']['provider'].lower()
+        self.client = self._initialize_client()
+        self._retry_options = self._create_retry_options()
+        
+        # Per-call settings resolved once instead of on every request
+        self._common_kwargs = {
+            "model": self.config['llm']['model'],
+            "temperature": self.config['llm']['temperature'],
+            "max_tokens": self.config['llm']['max_tokens']
+        }
+        self._dispatch = {
+            "openai": self._generate_openai_response,
+            "azure_openai": self._generate_openai_response,
+            "anthropic_vertex": lambda system_prompt, user_prompt, use_json_format:
+                self._generate_anthropic_response(system_prompt, user_prompt)
+        }[self._provider]
+        self._adispatch = {
+            "openai": self._agenerate_openai_response,
+            "azure_openai": self._agenerate_openai_response,
+            "anthropic_vertex": lambda client, system_prompt, user_prompt, use_json_format:
+                self._agenerate_anthropic_response(client, system_prompt, user_prompt)
+        }[self._provider]
+        
+        # Batch generation runs on one event loop per instance, so its async
+        # client and connections are reused across generate_many calls
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_client = None
+    
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """Load configuration from YAML file."""
+        try:
+            return load_yaml_cached(config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Configuration file not found: {config_path}\n"
+                "Please copy config/config_template.yaml to config/config.yaml and fill in your values."
+            )
+    
+    def _initialize_client(self):
+        """Return the shared SDK client for the configured provider."""
+        llm_config = self.config['llm']
+        key = (
+            self._provider,
+            llm_config.get('api_key'),
+            llm_config.get('api_base'),
+            llm_config.get('api_version'),
+            llm_config.get('project_id'),
+            llm_config.get('region')
+        )
+        
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = _CLIENT_CACHE[key] = self._create_client()
+        return client
+    
+    def _create_client(self):
+        """
+        Initialize the appropriate client based on provider.
+        
+        The SDKs' own retries are disabled so that generate_with_retry is the
+        only retry policy.
+        """
+        provider = self._provider
+        
+        if provider == "openai":
+            return _load_openai().OpenAI(
+                api_key=self.config['llm']['api_key'],
+                base_url=self.config['llm'].get('api_base'),
+                max_retries=0
+            )
+        
+        elif provider == "azure_openai":
+            return _load_openai().AzureOpenAI(
+                api_key=self.config['llm']['api_key'],
+                azure_endpoint=self.config['llm']['api_base'],
+                api_version=self.config['llm']['api_version'],
+                max_retries=0
+            )
+        
+        elif provider == "anthropic_vertex":
+            return _load_anthropic().AnthropicVertex(
+                project_id=self.config['llm']['project_id'],
+                region=self.config['llm']['region'],
+                max_retries=0
+            )
+        
+        else:
+            raise ValueError(f"Unsupported provider: {provider}")
+    
+    def _is_retryable(self) -> Callable[[BaseException], bool]:
+        """Build the predicate for transient API errors of the configured provider."""
+        provider = self._provider
+        
+        if provider in ["openai", "azure_openai"]:
+            sdk = _load_openai()
+        elif provider == "anthropic_vertex":
+            sdk = _load_anthropic()
+        else:
+            raise ValueError(f"Unsupported provider: {provider}")
+        
+        # Match on status codes rather than error classes: Vertex 503/504 and
+        # Anthropic 529 have their own classes outside InternalServerError.
+        # APITimeoutError is a subclass of APIConnectionError.
+        def is_retryable(error: BaseException) -> bool:
+            if isinstance(error, sdk.APIConnectionError):
+                return True
+            if isinstance(error, sdk.APIStatusError):
+                status_code = error.status_code
+                return status_code in _RETRYABLE_STATUS_CODES or status_code >= 500
+            return False
+        
+        return is_retryable
+    
+    def _create_retry_options(self) -> Dict[str, Any]:
+        """Build tenacity settings from the processing configuration."""
+        max_delay = self.config['processing']['max_delay']
+        backoff = wait_random_exponential(
+            multiplier=self.config['processing']['base_delay'],
+            max=max_delay
+        )
+        
+        def wait(retry_state: RetryCallState) -> float:
+            # Honor the server's Retry-After on rate limits, within max_delay
+            retry_after = _retry_after(retry_state.outcome.exception())
+            if retry_after is not None:
+                return min(retry_after, max_delay)
+            return backoff(retry_state)
+        
+        return {
+            "stop": stop_after_attempt(self.config['processing']['max_retries']),
+            "wait": wait,
+            "retry": retry_if_exception(self._is_retryable()),
+            "before_sleep": _log_retry,
+            "reraise": True
+        }
+    
+    def _create_async_client(self):
+        """
+        Create an asyncio SDK client for the configured provider.
+        
+        Async clients are bound to the event loop they are used on, so each
+        LLMClient keeps its own on its private loop rather than sharing it.
+        """
+        provider = self._provider
+        
+        if provider == "openai":
+            return _load_openai().AsyncOpenAI(
+                api_key=self.config['llm']['api_key'],
+                base_url=self.config['llm'].get('api_base'),
+                max_retries=0
+            )
+        
+        elif provider == "azure_openai":
+            return _load_openai().AsyncAzureOpenAI(
+                api_key=self.config['llm']['api_key'],
+                azure_endpoint=self.config['llm']['api_base'],
+                api_version=self.config['llm']['api_version'],
+                max_retries=0
+            )
+        
+        elif provider == "anthropic_vertex":
+            return _load_anthropic().AsyncAnthropicVertex(
+                project_id=self.config['llm']['project_id'],
+                region=self.config['llm']['region'],
+                max_retries=0
+            )
+        
+        else:
+            raise ValueError(f"Unsupported provider: {provider}")
+    
+    def generate_response(self, system_prompt: str, user_prompt: str, 
+                         use_json_format: bool = False) -> str:
+        """Generate response using the configured LLM."""
+        return self._dispatch(system_prompt, user_prompt, use_json_format)
+    
+    def _openai_request(self, system_prompt: str, user_prompt: str, 
+                        use_json_format: bool = False) -> Dict[str, Any]:
+        """Build the chat completion arguments for OpenAI API."""
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        
+        kwargs = {**self._common_kwargs, "messages": messages}
+        
+        if use_json_format:
+            kwargs["response_format"] = {"type": "json_object"}
+        
+        return kwargs
+    
+    def _anthropic_request(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """Build the message arguments for Anthropic API."""
+        return {
+            **self._common_kwargs,
+            "system": system_prompt,
+            "messages": [{"role": "user", "content": user_prompt}]
+        }
+    
+    def _generate_openai_response(self, system_prompt: str, user_prompt: str, 
+                                 use_json_format: bool = False) -> str:
+        """Generate response using OpenAI API."""
+        kwargs = self._openai_request(system_prompt, user_prompt, use_json_format)
+        response = self.client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
+    
+    def _generate_anthropic_response(self, system_prompt: str, user_prompt: str) -> str:
+        """Generate response using Anthropic API."""
+        response = self.client.messages.create(**self._anthropic_request(system_prompt, user_prompt))
+        return response.content[0].text
+    
+    def generate_with_retry(self, system_prompt: str, user_prompt: str, 
+                           use_json_format: bool = False) -> str:
+        """Generate response, retrying transient API errors with jittered backoff."""
+        retrying = Retrying(**self._retry_options)
+        return retrying(self.generate_response, system_prompt, user_prompt, use_json_format)
+    
+    def generate_many(self, prompts: List[Tuple[str, str]], 
+                      use_json_format: bool = False) -> List[Union[str, Exception]]:
+        """
+        Generate responses for several prompts concurrently.
+        
+        Args:
+            prompts: List of (system_prompt, user_prompt) tuples
+            use_json_format: Request JSON output (OpenAI providers only)
+            
+        Returns:
+            Responses in prompt order; a prompt that still fails after all
+            retries yields its exception instead of a response
+        """
+        if not prompts:
+            return []
+        
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self._generate_many_async(prompts, use_json_format))
+    
+    async def _generate_many_async(self, prompts: List[Tuple[str, str]], 
+                                   use_json_format: bool) -> List[Union[str, Exception]]:
+        """Run all prompts on one async client, bounded by the concurrency limit."""
+        if self._async_client is None:
+            self._async_client = self._create_async_client()
+        client = self._async_client
+        semaphore = asyncio.Semaphore(self.config['processing'].get('concurrency', 16))
+        
+        async def generate(system_prompt: str, user_prompt: str) -> str:
+            async with semaphore:
+                return await self._agenerate_with_retry(
+                    client, system_prompt, user_prompt, use_json_format
+                )
+        
+        return await asyncio.gather(
+            *(generate(system_prompt, user_prompt) for system_prompt, user_prompt in prompts),
+            return_exceptions=True
+        )
+    
+    async def _agenerate_with_retry(self, client, system_prompt: str, user_prompt: str, 
+                                    use_json_format: bool) -> str:
+        """Async counterpart of generate_with_retry."""
+        retrying = AsyncRetrying(**self._retry_options)
+        
+        # AsyncRetrying only awaits coroutine functions, and the Anthropic
+        # dispatch entry is a plain lambda returning a coroutine
+        async def attempt() -> str:
+            return await self._adispatch(client, system_prompt, user_prompt, use_json_format)
+        
+        return await retrying(attempt)
+    
+    async def _agenerate_openai_response(self, client, system_prompt: str, user_prompt: str, 
+                                         use_json_format: bool = False) -> str:
+        """Generate a response with an async OpenAI client."""
+        kwargs = self._openai_request(system_prompt, user_prompt, use_json_format)
+        response = await client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
+    
+    async def _agenerate_anthropic_response(self, client, system_prompt: str, user_prompt: str) -> str:
+        """Generate a response with an async Anthropic client."""
+        response = await client.messages.create(**self._anthropic_request(system_prompt, user_prompt))
+        return response.content[0].text
+
+
+def create_llm_client(config_path: str = "config/config.yaml") -> LLMClient:
+    """Factory function to create LLM client."""
+    return LLMClient(config_path)
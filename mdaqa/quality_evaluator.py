@@ -31,33 +31,34 @@ class QualityEvaluator:
         # Load paper contents
         paper_contents = self._get_paper_contents(support_papers)
         
-        evaluations = []
-        
-        for i, (paper_id, content) in enumerate(zip(support_papers, paper_contents)):
+        # Build one evaluation prompt per available paper
+        paper_ids = []
+        prompts = []
+        for paper_id, content in zip(support_papers, paper_contents):
             if content is None:
                 continue
             
-            # Generate evaluation prompt
             evaluation_prompt = self._create_evaluation_prompt(
                 question, paper_id, ground_truth, content
             )
-            
-            try:
-                # Generate evaluation
-                response = self.llm_client.generate_with_retry(
-                    content,  # Use paper content as system context
-                    evaluation_prompt
-                )
-                
-                evaluation = {
-                    "support_paper": paper_id,
-                    "evaluation": response
-                }
-                evaluations.append(evaluation)
-                
-            except Exception as e:
-                print(f"Error evaluating paper {paper_id}: {e}")
+            paper_ids.append(paper_id)
+            prompts.append((content, evaluation_prompt))  # Use paper content as system context
+        
+        # Generate all evaluations concurrently
+        responses = self.llm_client.generate_many(prompts)
+        
+        evaluations = []
+        
+        for paper_id, response in zip(paper_ids, responses):
+            if isinstance(response, BaseException):
+                print(f"Error evaluating paper {paper_id}: {response}")
                 continue
+            
+            evaluation = {
+                "support_paper": paper_id,
+                "evaluation": response
+            }
+            evaluations.append(evaluation)
         
         return evaluations
     
@@ -152,10 +153,13 @@ The output should be a JSON object with the following format:
                 evaluated_count += 1
                 
                 # Save progress
-                self.data_loader.save_progress(evaluations, evaluation_path)
+                self.data_loader.save_progress(evaluations, evaluation_path, append_record=evaluation_record)
                 
                 print(f"Progress: {evaluated_count}/{total_questions} questions evaluated")
         
+        # Fold the per-question checkpoints into the output file
+        self.data_loader.save_progress(evaluations, evaluation_path)
+        
         print(f"Evaluation complete. Results saved to {evaluation_path}")
     
     def generate_final_dataset(self) -> None:
@@ -183,11 +183,14 @@ Repeat the process to generate questions as much as possible.
             
             if result:
                 qa_data[community_id] = result
-                self.data_loader.save_progress(qa_data, qa_path)
+                self.data_loader.save_progress(qa_data, qa_path, append_record=(community_id, result))
                 print(f"Generated {len(result['questions'])} questions for community {community_id}")
             else:
                 print(f"Failed to generate questions for community {community_id}")
         
+        # Fold the per-community checkpoints into the output file
+        self.data_loader.save_progress(qa_data, qa_path)
+        
         print(f"Question generation complete. Results saved to {qa_path}")
 
 